@@ -1,45 +1,67 @@
 """The iss component."""
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
 import logging
+import os
+import time
 from zoneinfo import ZoneInfo
 
-import pyiss
-import requests
-from requests.exceptions import HTTPError
-from skyfield.api import load, wgs84
+from aiohttp import ClientError, ClientSession, ClientTimeout
+import numpy as np
+from sgp4.api import accelerated as sgp4_accelerated
+from skyfield.api import Loader, load, wgs84
 from skyfield.sgp4lib import EarthSatellite
-from skyfield.timelib import Time
+from skyfield.timelib import Time, Timescale
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     ALTIUDE_DEGREES,
+    API_LOCATION_URL,
+    API_PEOPLE_URL,
     CET_TIMEZONE,
     DOMAIN,
     OBSERVER_LATITUDE,
     OBSERVER_LONGITUDE,
+    PASS_CACHE_MAX_AGE,
     SATELLITE_NAME,
     STATIONS_URL,
+    TLE_MAX_AGE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR]
 
+_EVENT_NAMES = (
+    f"rise above {ALTIUDE_DEGREES}",
+    "culminate",
+    f"set below {ALTIUDE_DEGREES}",
+)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IssData:
-    """Dataclass representation of data returned from pyiss."""
+    """Dataclass representation of data returned from the open-notify API."""
 
     number_of_people_in_space: int
     current_location: dict[str, str]
-    iss_passes: dict[str, str]
+    iss_passes: list[dict]
+
+
+async def _fetch_json(session: ClientSession, url: str) -> dict:
+    """Fetch a JSON document from the open-notify API."""
+    async with session.get(url, timeout=ClientTimeout(total=10)) as response:
+        response.raise_for_status()
+        return await response.json()
 
 
 class SatellitePass:
@@ -52,6 +74,30 @@ class SatellitePass:
     azimuth: int
 
 
+@lru_cache(maxsize=1)
+def get_timescale() -> Timescale:
+    """Return a cached Skyfield timescale.
+
+    Building a timescale reparses the leap-second data, so it is done once
+    and reused for every update. The builtin tables avoid a network fetch.
+
+    Returns:
+        Timescale: The shared Skyfield timescale object.
+    """
+    return load.timescale(builtin=True)
+
+
+@lru_cache(maxsize=2)
+def _end_of_next_day(ordinal: int) -> Time:
+    """Return the cached 23:59:59 UTC bound for the day after `ordinal`.
+
+    The upper bound of the search range only changes once per day, so the
+    Time object is built once per day ordinal instead of on every update.
+    """
+    next_day = date.fromordinal(ordinal) + timedelta(days=1)
+    return get_timescale().utc(next_day.year, next_day.month, next_day.day, 23, 59, 59)
+
+
 def define_time_range(now: datetime) -> tuple:
     """Define a time range spanning from the current time to the end of the next day.
 
@@ -64,19 +110,13 @@ def define_time_range(now: datetime) -> tuple:
             The first element is the current time.
             The second element is the end time of the next day.
     """
-    tomorrow = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
-        days=1
-    )
+    # Naive datetimes are interpreted as UTC, as the component-wise
+    # timescale.utc() call used to do
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=UTC)
 
-    # Define a time range
-    local_timescale = load.timescale()
-
-    current_time = local_timescale.utc(
-        now.year, now.month, now.day, now.hour, now.minute, now.second
-    )
-    next_day_time = local_timescale.utc(
-        tomorrow.year, tomorrow.month, tomorrow.day, 23, 59, 59
-    )
+    current_time = get_timescale().from_datetime(now)
+    next_day_time = _end_of_next_day(now.toordinal())
 
     return current_time, next_day_time
 
@@ -119,49 +159,57 @@ def get_pass_details(
         list: A list of dictionaries containing pass details.
     """
 
-    # Initialize local variables
-    pass_details: list = []
-    pass_count = 0
-    event_names = [
-        f"rise above {ALTIUDE_DEGREES}",
-        "culminate",
-        f"set below {ALTIUDE_DEGREES}",
-    ]
-
-    # Iterate through passes and events
-    for ti, event in zip(t, events):
-        if event == 0:
-            pass_count += 1
-            pass_details.append({})
-        event_name = event_names[event]
-        local_time = ti.astimezone(observer_timezone)
+    events = np.asarray(events)
+    if events.size == 0:
+        return []
+
+    # The difference vector is the same for every event, so build it once
+    # and compute altaz for the whole time array in a single Skyfield call
+    difference = skyfield_satellite_object - observer_location
+    alt, az, _ = difference.at(t).altaz()
+
+    # Convert the whole time array to datetimes in one call
+    utc_datetimes = t.utc_datetime()
+
+    # Events with code 0 start a new pass; group by their running count
+    pass_indices = np.cumsum(events == 0) - 1
+    pass_details: list = [{} for _ in range(pass_indices[-1] + 1)]
+
+    for i, utc_datetime in enumerate(utc_datetimes):
+        if pass_indices[i] < 0:
+            # The satellite was already above the threshold at the window
+            # start; skip the partial pass preceding the first rise
+            continue
+        event_name = _EVENT_NAMES[events[i]]
+        local_time = utc_datetime.astimezone(observer_timezone)
         dt = local_time.strftime("%Y %b %d %H:%M:%S")
-        alt, az, d = (skyfield_satellite_object - observer_location).at(ti).altaz()
-        pass_details[pass_count - 1][event_name] = {
+        pass_details[pass_indices[i]][event_name] = {
             "Datetime": dt,
-            "Azimuth": az.degrees,
-            "Altitude": alt.degrees,
+            "Azimuth": az.degrees[i],
+            "Altitude": alt.degrees[i],
         }
 
     return pass_details
 
 
-def update(iss: pyiss.ISS, skyfield_satellite_object: EarthSatellite) -> IssData:
-    """Update and retrieve data from the pyiss API for the International Space Station (ISS).
+def compute_iss_passes(
+    skyfield_satellite_object: EarthSatellite,
+    observer_location,
+    observer_timezone: ZoneInfo,
+) -> tuple:
+    """Compute upcoming ISS passes for the given observer.
 
     Args:
-        iss (pyiss.ISS): An instance of the pyiss.ISS class for ISS data retrieval.
         skyfield_satellite_object (EarthSatellite): A Skyfield EarthSatellite object representing the ISS.
+        observer_location: The geographic location of the observer.
+        observer_timezone (ZoneInfo): The timezone information for the observer.
 
     Returns:
-        IssData: An IssData object containing updated information.
+        tuple: The list of pass detail dictionaries and the UTC datetime
+            until which the computed schedule stays valid.
     """
 
-    observer_location, observer_timezone = define_observer_information(
-        OBSERVER_LATITUDE, OBSERVER_LONGITUDE, CET_TIMEZONE
-    )
-
-    current_time, next_day_time = define_time_range(datetime.now())
+    current_time, next_day_time = define_time_range(datetime.now(UTC))
 
     # Find ISS passes
     t, events = skyfield_satellite_object.find_events(
@@ -172,16 +220,60 @@ def update(iss: pyiss.ISS, skyfield_satellite_object: EarthSatellite) -> IssData
         t, events, observer_timezone, observer_location, skyfield_satellite_object
     )
 
-    return IssData(
-        number_of_people_in_space=iss.number_of_people_in_space(),
-        current_location=iss.current_location(),
-        iss_passes=pass_details[0]["culminate"],
+    # The schedule only changes once the first pass completes, so it can be
+    # reused until that set event (capped at PASS_CACHE_MAX_AGE)
+    valid_until = datetime.now(UTC) + timedelta(seconds=PASS_CACHE_MAX_AGE)
+    set_indices = np.flatnonzero(np.asarray(events) == 2)
+    if set_indices.size:
+        valid_until = min(valid_until, t[int(set_indices[0])].utc_datetime())
+
+    return pass_details, valid_until
+
+
+def _tle_path(cache_dir: str) -> str:
+    """Return the path of the cached TLE file inside `cache_dir`."""
+    return os.path.join(cache_dir, STATIONS_URL.rsplit("/", maxsplit=1)[-1])
+
+
+def load_satellites(cache_dir: str) -> list:
+    """Load the lists of available satellites from the Skyfield API.
+
+    The downloaded TLE file is kept in `cache_dir` and only re-fetched once
+    it is older than a day, which is roughly how long Celestrak elements
+    stay fresh.
+
+    Args:
+        cache_dir (str): Directory where the downloaded TLE file is stored.
+    """
+    loader = Loader(cache_dir, verbose=False)
+    tle_path = _tle_path(cache_dir)
+    reload_tle = (
+        os.path.exists(tle_path)
+        and time.time() - os.path.getmtime(tle_path) > TLE_MAX_AGE
     )
+    return loader.tle_file(STATIONS_URL, reload=reload_tle)
+
+
+@lru_cache(maxsize=1)
+def _satellites_by_name(cache_dir: str, tle_mtime: float) -> dict:
+    """Parse the cached TLE file and index the satellites by name.
 
+    `tle_mtime` keys the cache, so the index is only rebuilt once the TLE
+    file has been re-downloaded.
+    """
+    return {sat.name: sat for sat in load_satellites(cache_dir)}
+
+
+def get_satellite(cache_dir: str, satellite_name: str):
+    """Return the satellite with the given name from the cached TLE data.
 
-def load_satellites() -> list:
-    """Load the lists of available satellites from the Skyfield API."""
-    return load.tle_file(STATIONS_URL)
+    Args:
+        cache_dir (str): Directory where the downloaded TLE file is stored.
+        satellite_name (str): The desired satellite object to select.
+    """
+    tle_path = _tle_path(cache_dir)
+    tle_mtime = os.path.getmtime(tle_path) if os.path.exists(tle_path) else 0.0
+    return _satellites_by_name(cache_dir, tle_mtime)[satellite_name]
 
 
 def select_satellite(satellites: list, satellite_name: str):
@@ -200,20 +292,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     hass.data.setdefault(DOMAIN, {})
 
-    # satellites = await hass.async_add_executor_job(load.tle_file, (STATIONS_URL, reload=True))
-    satellites = await hass.async_add_executor_job(load_satellites)
+    if not sgp4_accelerated:
+        _LOGGER.warning(
+            "The sgp4 C++ extension is not available; satellite propagation"
+            " falls back to the slower pure-Python implementation"
+        )
+
+    # Warm the timescale cache off the event loop so the first refresh is fast
+    await hass.async_add_executor_job(get_timescale)
+
     satellite = await hass.async_add_executor_job(
-        select_satellite, satellites, SATELLITE_NAME
+        get_satellite, hass.config.path("skyfield_cache"), SATELLITE_NAME
+    )
+
+    # The observer is fixed, so resolve the location and timezone once
+    # (ZoneInfo reads the tz database from disk, hence the executor job)
+    observer_location, observer_timezone = await hass.async_add_executor_job(
+        define_observer_information, OBSERVER_LATITUDE, OBSERVER_LONGITUDE, CET_TIMEZONE
     )
 
-    iss = pyiss.ISS()
+    session = async_get_clientsession(hass)
+
+    cached_passes: list = []
+    cache_valid_until = datetime.min.replace(tzinfo=UTC)
 
     async def async_update() -> IssData:
+        nonlocal cached_passes, cache_valid_until
+
         try:
-            return await hass.async_add_executor_job(update, iss, satellite)
-        except (HTTPError, requests.exceptions.ConnectionError) as ex:
+            if datetime.now(UTC) < cache_valid_until:
+                # The pass schedule is still valid; only refresh the API data
+                astros, location = await asyncio.gather(
+                    _fetch_json(session, API_PEOPLE_URL),
+                    _fetch_json(session, API_LOCATION_URL),
+                )
+            else:
+                # The HTTP fetches and the CPU-bound pass computation are
+                # independent, so run them concurrently
+                (
+                    astros,
+                    location,
+                    (cached_passes, cache_valid_until),
+                ) = await asyncio.gather(
+                    _fetch_json(session, API_PEOPLE_URL),
+                    _fetch_json(session, API_LOCATION_URL),
+                    hass.async_add_executor_job(
+                        compute_iss_passes,
+                        satellite,
+                        observer_location,
+                        observer_timezone,
+                    ),
+                )
+        except (ClientError, asyncio.TimeoutError) as ex:
             raise UpdateFailed("Unable to retrieve data") from ex
 
+        return IssData(
+            number_of_people_in_space=astros["number"],
+            current_location=location["iss_position"],
+            iss_passes=cached_passes,
+        )
+
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
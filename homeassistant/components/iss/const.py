@@ -8,6 +8,13 @@ SATELLITE_NAME = "ISS (ZARYA)"
 
 STATIONS_URL = "http://celestrak.org/NORAD/elements/stations.txt"
 
+API_PEOPLE_URL = "http://api.open-notify.org/astros.json"
+API_LOCATION_URL = "http://api.open-notify.org/iss-now.json"
+
+TLE_MAX_AGE = 86400  # seconds before the cached TLE file is re-downloaded
+
+PASS_CACHE_MAX_AGE = 21600  # seconds before the cached pass schedule is recomputed
+
 OBSERVER_LATITUDE = +40.74265880253742
 
 OBSERVER_LONGITUDE = -84.10788623396293
@@ -21,6 +21,17 @@ from .const import DEFAULT_NAME, DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 
+def _next_culmination(data: IssData) -> dict:
+    """Return the culmination details of the next ISS pass.
+
+    Returns an empty dict when no pass is scheduled, so lookups on the
+    result yield None instead of raising.
+    """
+    if not data.iss_passes:
+        return {}
+    return data.iss_passes[0].get("culminate", {})
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -57,6 +68,12 @@ class IssSensor(CoordinatorEntity[DataUpdateCoordinator[IssData]], SensorEntity)
     ) -> None:
         """Initialize the sensor."""
         self._key = key
+        self._getter = {
+            "people": lambda data: data.number_of_people_in_space,
+            "pass_azimuth": lambda data: _next_culmination(data).get("Azimuth"),
+            "pass_altitude": lambda data: _next_culmination(data).get("Altitude"),
+            "pass_time": lambda data: _next_culmination(data).get("Datetime"),
+        }[key]
         super().__init__(coordinator)
         self.entity_id = f"sensor.iss_{key}"
         self._attr_unique_id = f"{entry.entry_id}_{key}"
@@ -69,14 +86,8 @@ class IssSensor(CoordinatorEntity[DataUpdateCoordinator[IssData]], SensorEntity)
 
     @property
     def native_value(self):
-        """Return number of people in space."""
-        if self._key == "people":
-            return self.coordinator.data.number_of_people_in_space
-        if self._key == "pass_azimuth":
-            return self.coordinator.data.iss_passes.get("Azimuth")
-        if self._key == "pass_altitude":
-            return self.coordinator.data.iss_passes.get("Altitude")
-        return self.coordinator.data.iss_passes.get("Datetime")
+        """Return the value for this sensor's key."""
+        return self._getter(self.coordinator.data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -89,13 +100,11 @@ class IssSensor(CoordinatorEntity[DataUpdateCoordinator[IssData]], SensorEntity)
             attrs[ATTR_LATITUDE] = self.coordinator.data.current_location.get(
                 "latitude"
             )
-            attrs["pass_time"] = self.coordinator.data.iss_passes.get("Datetime")
-            attrs["pass_azimuth"] = self.coordinator.data.iss_passes.get("Azimuth")
-            attrs["pass_altitude"] = self.coordinator.data.iss_passes.get("Altitude")
-
-            attrs["pass_time"] = self.coordinator.data.iss_passes.get("Datetime")
-            attrs["pass_azimuth"] = self.coordinator.data.iss_passes.get("Azimuth")
-            attrs["pass_altitude"] = self.coordinator.data.iss_passes.get("Altitude")
+            next_pass = _next_culmination(self.coordinator.data)
+            attrs["pass_time"] = next_pass.get("Datetime")
+            attrs["pass_azimuth"] = next_pass.get("Azimuth")
+            attrs["pass_altitude"] = next_pass.get("Altitude")
+            attrs["upcoming_passes"] = self.coordinator.data.iss_passes
 
         else:
             attrs["long"] = self.coordinator.data.current_location.get("longitude")
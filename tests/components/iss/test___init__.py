@@ -1,11 +1,13 @@
 """Tests for functions in __init__.py."""
 
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 
+from freezegun import freeze_time
 from skyfield.api import load
 from skyfield.timelib import Time
 
 from homeassistant.components.iss import (
+    compute_iss_passes,
     define_observer_information,
     define_time_range,
     get_pass_details,
@@ -16,6 +18,7 @@ from homeassistant.components.iss.const import (
     CET_TIMEZONE,
     OBSERVER_LATITUDE,
     OBSERVER_LONGITUDE,
+    PASS_CACHE_MAX_AGE,
 )
 
 
@@ -82,6 +85,33 @@ def test_define_time_range() -> None:
     assert isinstance(end_time, Time)
 
 
+@freeze_time("2023-10-25 14:30:00")
+def test_compute_iss_passes_valid_until() -> None:
+    """Test that the pass schedule deadline lies in the future."""
+    satellites = load.tle_file("tests/components/iss/mock_data.txt")
+
+    satellite = select_satellite(satellites, "ISS (ZARYA)")
+
+    observer_location, observer_timezone = define_observer_information(
+        OBSERVER_LATITUDE, OBSERVER_LONGITUDE, CET_TIMEZONE
+    )
+
+    pass_details, valid_until = compute_iss_passes(
+        satellite, observer_location, observer_timezone
+    )
+
+    # The schedule must stay valid from now until at most the cache cap
+    now = datetime.now(UTC)
+    assert now < valid_until <= now + timedelta(seconds=PASS_CACHE_MAX_AGE)
+
+    # The deadline is the set event that ends the first pass
+    first_set = datetime.strptime(
+        pass_details[0][f"set below {ALTIUDE_DEGREES}"]["Datetime"],
+        "%Y %b %d %H:%M:%S",
+    ).replace(tzinfo=observer_timezone)
+    assert abs(valid_until - first_set) < timedelta(seconds=1)
+
+
 def test_load_satellites() -> None:
     """Test for the loading of satellites available in the API."""
 